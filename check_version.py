@@ -23,9 +23,9 @@ from py2048 import __version__ as global_version, APPNAME
 
 def get_local_version():
     version_line = None
-    path = os.path.join(APPNAME, "__init__.py")
-    with open(path) as init:
-        for line in init:
+    path = os.path.join(APPNAME, "_version.py")
+    with open(path) as version_file:
+        for line in version_file:
             if line.startswith("__version__"):
                 version_line = line
                 break
@@ -17,13 +17,10 @@
 # You should have received a copy of the GNU General Public License
 # along with py2048.  If not, see <https://www.gnu.org/licenses/>.
 
-# these basic "constants" are declared here before imports because
+# these basic "constants" are imported before anything else because
 # other modules we import require them, so we're avoiding circular
 # importing errors
-_TESTING = False  # used only in setup.py
-__version__ = (0, 48)
-VERSION = ".".join(map(str, __version__))
-APPNAME = __name__
+from py2048._version import _TESTING, APPNAME, VERSION, __version__
 
 from py2048.basefrontend import Base2048Frontend
 from py2048.cell import Cell, Tissue
@@ -52,5 +49,7 @@ from py2048.utils import (
     hexid,
     is_container,
     type_check,
+    type_check_any,
+    type_check_one,
     typename,
 )
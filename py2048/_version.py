@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#
+# _version.py
+#
+# This file is part of py2048.
+#
+# py2048 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# py2048 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with py2048.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Declares the basic "constants" of the package.
+
+They're kept in this module, which imports nothing, so that setup.py
+can read them without importing the package (and its dependencies).
+"""
+
+_TESTING = False  # used only in setup.py
+__version__ = (0, 48)
+VERSION = ".".join(map(str, __version__))
+APPNAME = "py2048"
@@ -27,7 +27,7 @@ from typing import Any, final, Optional
 
 from py2048.core import Directions
 from py2048.grid import Grid
-from py2048.utils import Base2048Error, type_check
+from py2048.utils import Base2048Error, type_check_one
 
 
 class Base2048Frontend(ABC):
@@ -59,7 +59,7 @@ class Base2048Frontend(ABC):
         goal: Optional[int] = None,
     ) -> None:
         # first, perform some checks
-        type_check(grid, Grid)
+        type_check_one(grid, Grid)
         # `goal = goal or 2048` would allow "goal = 0" to pass silently
         if goal is None:
             goal = 2048
@@ -21,7 +21,6 @@
 in the game grid.
 """
 
-from functools import partialmethod
 from typing import Sequence
 
 from py2048.core import Point
@@ -29,7 +28,7 @@ from py2048.utils import (
     ExpectationError,
     CellError,
     either_0_power2,
-    type_check,
+    type_check_one,
 )
 
 
@@ -38,17 +37,18 @@ class Cell:
 
     The `Point` of a `Cell` 'c' can be accessed as `c.point`, and
     its coordinates directly accessed as `c.x` and `c.y`.
-    Besides storing and validating integers, this class contains a
-    `_lock` boolean that represents whether it can move in this cycle
-    (this prevents an 8 moving into another 8 and the resulting 16
-    merging into another 16, for example).
+    Besides that, this class only stores and validates integers: the
+    `Grid` decides how Cells move and merge.
     """
 
+    # a grid holds `side**2` Cells for its whole life, so they don't
+    # need a per-instance `__dict__`
+    __slots__ = ("point", "x", "y", "_number")
+
     def __init__(self, point: Point, number: int = 0) -> None:
-        type_check(point, Point)
+        type_check_one(point, Point)
         self.point = point
         self.x, self.y = point
-        self._lock = False
         # don't use self._number here; we want bad initial values to be
         # detected
         self.number: int = number
@@ -65,6 +65,17 @@ class Cell:
             raise CellError(f"Cannot assign non-power of 2 {value} to {self!r}")
         self._number = value
 
+    def __getstate__(self) -> tuple:
+        # without a `__dict__`, pickle protocols 0 and 1 need to be told
+        # what to save; subclasses may still have one, so it goes along
+        return self.point, self._number, getattr(self, "__dict__", None)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.point, self._number, attributes = state
+        self.x, self.y = self.point
+        if attributes:
+            self.__dict__.update(attributes)
+
     def __bool__(self) -> bool:
         return bool(self._number)
 
@@ -91,29 +102,6 @@ class Cell:
             return self.point > other.point
         return NotImplemented
 
-    def _set_lock(self, onoff: bool) -> None:
-        type_check(onoff, bool)
-        if onoff and not self._number:
-            raise CellError(f"Cannot lock 0-numbered Cell: {self!r}")
-        self._lock = onoff
-
-    is_locked = property(
-        fget=lambda self: self._lock,
-        fset=_set_lock,
-        doc=(
-            "`is_locked` is a `bool` that tells whether the `Cell` has "
-            "already moved this cycle. "
-            "This prevents a 2 merging into a 2 and the resulting 4 "
-            "merging into another 4 all in a single movement, "
-            "for example. "
-            "The value can be assigned directly (as in `c.is_locked = True`), "
-            "or through the `lock` and `unlock` methods."
-        ),
-    )
-
-    lock = partialmethod(_set_lock, True)
-    unlock = partialmethod(_set_lock, False)
-
     def __repr__(self) -> str:
         return f"Cell({self.x}, {self.y}, {self._number})"
 
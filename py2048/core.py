@@ -56,9 +56,10 @@ from py2048.utils import (
     EMPTY_TUPLE,
     NONE_SLICE,
     EllipsisType,
+    _checked_int,
     check_int,
     is_container,
-    type_check,
+    type_check_one,
     typename,
 )
 
@@ -98,6 +99,16 @@ class Point(namedtuple("_Point", "x y")):
         self = super(Point, cls).__new__(cls, x, y)
         return self
 
+    @classmethod
+    def _trusted(cls, x: int, y: int) -> Point:
+        """Create a Point from coordinates computed by the package
+        itself, which are only checked when running without `-O`.
+        """
+
+        _checked_int(x)
+        _checked_int(y)
+        return tuple.__new__(cls, (x, y))
+
     def __str__(self) -> str:
         return f"<{self.x},{self.y}>"
 
@@ -255,12 +266,13 @@ class BaseGameGrid(ABC):
         constructor = self.CELLCONSTRUCTOR or cellclass
         for x in range(width):
             for y in range(height):
-                point = Point(x, y)
+                point = Point._trusted(x, y)
                 try:
                     self.mapping[point] = constructor(point)
                 except TypeError:
                     self.mapping[point] = constructor()
-        self.check_integrity()
+        if __debug__:
+            self.check_integrity()
 
     # -- "private" methods (except `repr` and `str`)
     def __len__(self) -> int:
@@ -361,7 +373,7 @@ class BaseGameGrid(ABC):
         if necessary.
         """
 
-        type_check(value, self.CELLCLASS)
+        type_check_one(value, self.CELLCLASS)
         self.mapping[key] = value
 
     def _set_xy(self, x: int, y: int, value: CELLCLASS) -> None:
@@ -387,7 +399,8 @@ class BaseGameGrid(ABC):
             )
         for point, point_value in zip(selecteds, value):
             self._set_point(point, point_value)
-        self.check_integrity()
+        if __debug__:
+            self.check_integrity()
 
     # -- "public" methods
     def keys(self, by: RowOrCol = "rows") -> Iterator[Point]:
@@ -473,7 +486,7 @@ class BaseGameGrid(ABC):
         )
         # type check
         for value in self.values():
-            type_check(value, self.CELLCLASS)
+            type_check_one(value, self.CELLCLASS)
         # total size check
         width_height = width * height
         assert self_len == width_height, (
@@ -25,31 +25,82 @@ records game states.
 # https://www.python.org/dev/peps/pep-0563/
 from __future__ import annotations
 
+import functools
 import logging
 import random
 import sys
-from functools import partial
-from itertools import chain
-from typing import (
-    Callable,
-    Iterable,
-    Iterator,
-    Optional,
-    cast,
-)
+from typing import Callable, Iterator, Optional
 
 from py2048.cell import Cell
-from py2048.core import SquareGameGrid, Directions, Line, Point, Snapshot
+from py2048.core import (
+    SquareGameGrid,
+    Directions,
+    Point,
+    RowOrCol,
+    Snapshot,
+)
 from py2048.utils import (
+    CellError,
     ExpectationError,
     GridError,
-    NegativeIntegerError,
     classname,
-    either_0_power2,
 )
 
 logger = logging.getLogger(__name__)
 
+# maps a row (as an `int`) into a pair made of the row after sliding
+# and how much the score increases due to merges
+SlideTable = dict[int, tuple[int, int]]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_layout(side: int, bits: int) -> tuple[Callable, Callable]:
+    """Return a pair of functions specialized for the given layout:
+    `transpose(board)` and `slide_rows(board, table, new_slide, reverse)`.
+
+    Their source is generated with every row, mask and shift written
+    as a literal and then `exec`uted, just like `dataclasses` does to
+    create `__init__` methods, so that they run without loops or
+    attribute lookups. Each layout is compiled once per process.
+    """
+
+    row_bits = side * bits
+    row_mask = (1 << row_bits) - 1
+    field = (1 << bits) - 1
+    # transposing moves the field at (x, y) by `(x - y) * (side - 1)`
+    # fields, so every diagonal can be moved with one mask and shift
+    step = (side - 1) * bits
+    terms = []
+    for diagonal in range(1 - side, side):
+        mask = sum(
+            field << ((y * side + x) * bits)
+            for y in range(side)
+            for x in range(side)
+            if x - y == diagonal
+        )
+        shift = diagonal * step
+        if shift > 0:
+            terms.append(f"((board & {mask:#x}) << {shift})")
+        elif shift < 0:
+            terms.append(f"((board & {mask:#x}) >> {-shift})")
+        else:
+            terms.append(f"(board & {mask:#x})")
+    lines = ["def transpose(board):", "    return " + " | ".join(terms)]
+    # each row is looked up in `table`, and slid by `new_slide` if it's
+    # not there yet
+    lines.append("def slide_rows(board, table, new_slide, reverse):")
+    for y in range(side):
+        lines.append(f"    row{y} = (board >> {y * row_bits}) & {row_mask:#x}")
+        lines.append(
+            f"    slide{y} = table.get(row{y}) or new_slide(row{y}, reverse)"
+        )
+    rows = " | ".join(f"(slide{y}[0] << {y * row_bits})" for y in range(side))
+    scores = " + ".join(f"slide{y}[1]" for y in range(side))
+    lines.append(f"    return {rows}, {scores}")
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["transpose"], namespace["slide_rows"]
+
 
 class Grid(SquareGameGrid):
     """Matrix of `Cell`s.
@@ -60,6 +111,12 @@ class Grid(SquareGameGrid):
     It's not intended to display the game state, although `__str__`
     returns each row in a separate line.
 
+    The game state itself is kept in a single `int`, the "board": each
+    Cell owns a fixed-width field of bits holding the exponent of its
+    number (0 stays 0, 2 becomes 1, 2048 becomes 11, and so on). The
+    Cells are kept in sync with the board, so they can still be read
+    as usual, but the game logic only deals with the board.
+
     --------------------------------------------------------------------
     Attributes (non-callable):
     attempt: int
@@ -68,8 +125,8 @@ class Grid(SquareGameGrid):
         How many times the game state has changed.
     empty_cells: set[Cell]
         Which Cells are empty (0-numbered).
-    history: list[Snapshot]
-        The game states since the last reset, from oldest to newest.
+    history: list[int]
+        The boards since the last reset, from oldest to newest.
     is_empty: bool
         Whether every Cell is 0-numbered.
     is_jammed: bool
@@ -78,6 +135,8 @@ class Grid(SquareGameGrid):
         The number of the highest(s) Cell(s).
     score: int
         Counter that increases by N each time an N-Cell appears.
+    snapshot: Snapshot
+        The current game state, mapping each Point to its number.
 
     Main ("public") methods:
     autofill(self, no_jamming: bool = True) -> None:
@@ -90,6 +149,8 @@ class Grid(SquareGameGrid):
         Reset all counters and Cells, clear the snapshots history.
     seed(self, amount: int = STARTING_AMOUNT) -> None:
         Assign a random initial value to random empty Cells.
+    snapshots(self) -> Iterator[Snapshot]:
+        Yield each game state in `self.history` as a `Snapshot`.
     store_snapshot(self, snapshot: Optional[Snapshot] = None) -> None:
         Store a game state in `self.history`.
     undo(self, ignore_empty: bool = True) -> bool
@@ -105,30 +166,44 @@ class Grid(SquareGameGrid):
     # what values can be seeded in each Cell; tuple instead of set
     # because random.choice doesn't work with sets
     SEEDING_VALUES = (2, 4)
-    # this list might be used by concrete frontends, for example for
+    # how likely each of the SEEDING_VALUES is to be picked, relative to
+    # each other, as in the `weights` of `random.choices`; if None, all
+    # of them are equally likely
+    SEEDING_WEIGHTS: Optional[tuple[int, ...]] = None
+    # this tuple might be used by concrete frontends, for example for
     # displaying each 2048 number as an image
     # 2**11 == 2048
-    NUMBERS: list[int] = [2 ** power for power in range(1, 12)]
+    NUMBERS: tuple[int, ...] = tuple(2 ** power for power in range(1, 12))
     # no power of 2 higher than CEILING will be accepted as the
     # game's goal
     # sys.maxsize == (2**63)-1 on 64bits machines
     CEILING = sys.maxsize // 2
-    cells = SquareGameGrid.values
 
     # -- "private" class variables
     # _AUTO_NUMBERS is used to fill the grid with random numbers
     # (for testing and debugging)
     _AUTO_NUMBERS = NUMBERS[:-1]
-    # _SHIFTS maps each `Directions` into a x-y "displacement";
-    # so `LEFT: (-1, 0)` means that to be at the left of (x, y) is to
-    # be at (x-1, y), which may or may be not valid coordinates for
-    # a Point
-    _SHIFTS = {
-        Directions.LEFT: (-1, 0),
-        Directions.RIGHT: (1, 0),
-        Directions.DOWN: (0, 1),
-        Directions.UP: (0, -1),
+    # _DRAG_MODES maps each `Directions` into a pair of `bool`s: whether
+    # the board must be transposed (so that its columns become rows)
+    # and whether each row must be reversed (so that its last Cell
+    # becomes the first) before sliding its rows to the left
+    _DRAG_MODES = {
+        Directions.LEFT: (False, False),
+        Directions.RIGHT: (False, True),
+        Directions.UP: (True, False),
+        Directions.DOWN: (True, True),
     }
+    # _SLIDE_TABLES maps a row layout, `(side, bits)`, into a pair of
+    # SlideTables (sliding to the left in the first, to the right in the
+    # second); every Grid of the same class and layout shares them, and
+    # they're filled as new rows show up. Each subclass gets its own
+    # dict, since it may slide or merge rows differently, and the
+    # tables go away along with the class
+    _SLIDE_TABLES: dict[tuple[int, int], tuple[SlideTable, SlideTable]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._SLIDE_TABLES = {}
 
     def __init__(self, side: int = 4) -> None:
         # this creates an empty Grid; to create one from some other
@@ -145,17 +220,49 @@ class Grid(SquareGameGrid):
                 f"{side_squared} STARTING_AMOUNT's"
             )
         super().__init__(side)
-        self._vectors_getters: dict[Directions, Callable] = {
-            # no parenthesis here! remember not to call these methods!
-            Directions.LEFT: self.columns,
-            Directions.RIGHT: partial(self.columns, reverse=True),
-            Directions.UP: self.rows,
-            Directions.DOWN: partial(self.rows, reverse=True),
-        }
-        # as the grid starts empty, every Cell starts in the
-        # `empty_cells` set
-        self.empty_cells: set[Cell] = set(self.cells())
-        self.history: list[Snapshot] = []
+        # -- the board layout
+        # the Cell at (x, y) has index `y*side + x`, and its field is
+        # made of the bits from `index*_bits` to `(index+1)*_bits - 1`;
+        # each field must fit the exponent of any number the game can
+        # reach: CEILING only caps the goal, and merges can go past it
+        # by building up to one exponent per Cell above the highest
+        # seeded one
+        self._side = side
+        highest_seed = max(self.SEEDING_VALUES).bit_length() - 1
+        reachable = max(
+            self.CEILING.bit_length() - 1, side_squared - 1 + highest_seed
+        )
+        self._bits = bits = reachable.bit_length()
+        self._field = (1 << bits) - 1
+        self._row_bits = side * bits
+        # the offset of the first bit of each field
+        self._field_shifts = tuple(range(0, side_squared * bits, bits))
+        # `_low` has the lowest bit of every field set; `_low_h` only
+        # of the fields that have a neighbor to their right, and
+        # `_low_v` only of those that have a neighbor below them
+        self._low = sum(1 << (index * bits) for index in range(side_squared))
+        self._low_h = sum(
+            1 << ((y * side + x) * bits)
+            for y in range(side)
+            for x in range(side - 1)
+        )
+        self._low_v = self._low >> self._row_bits
+        # the Cells ordered by their indexes: from the top row to the
+        # bottom one, each row from left to right
+        self._flat: tuple[Cell, ...] = tuple(self.values(by="rows"))
+        self._bind_layout()
+        # as the grid starts empty, so does the board, and every Cell
+        # is set in `_empty_mask`, in which bit i is set iff the Cell
+        # with index i is empty
+        self._board = 0
+        self._empty_mask = (1 << side_squared) - 1
+        # the exponent of the largest number on the board, kept up to
+        # date as fields change; `None` when the largest Cell may have
+        # been overwritten, so that `largest` must look for it again
+        self._top: Optional[int] = 0
+        # the history keeps boards rather than `Snapshot`s: they're
+        # immutable, so they can be stored as they are, and far smaller
+        self.history: list[int] = []
         # `attempt` is how many times the player has given input, even
         # if that didn't change the game state
         self.attempt = 0
@@ -167,17 +274,42 @@ class Grid(SquareGameGrid):
         # the grid could start jammed if
         # self.STARTING_AMOUNT == len(self)
         if self.is_jammed:
-            random_cell = random.choice(tuple(self.cells()))
+            random_cell = random.choice(self._flat)
             self._set_cell(random_cell, 0)
             self.store_snapshot()
         # do not store a snapshot in this case: the player shouldn't be
         # able to "undo" the grid until it's totally empty!
-        self.check_integrity()
+        # `check_integrity` is made of asserts, which `python -O` strips
+        # anyway, so skip its loops as well in that case
+        if __debug__:
+            self.check_integrity()
 
     # -- "private" methods
+    def _bind_layout(self) -> None:
+        """Fetch the slide tables shared by every Grid of the same class
+        and layout as this one, and the compiled functions shared by
+        every Grid of the same layout."""
+
+        layout = (self._side, self._bits)
+        self._slide_tables = self._SLIDE_TABLES.setdefault(layout, ({}, {}))
+        self._transpose, self._slide_rows = _compile_layout(*layout)
+
+    def __getstate__(self) -> dict:
+        # the slide tables are shared by many Grids and can grow large,
+        # and the compiled functions can't be pickled, so they're not
+        # pickled along with this one
+        state = self.__dict__.copy()
+        for name in ("_slide_tables", "_transpose", "_slide_rows"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._bind_layout()
+
     def _set_point(self, key: Point, number: int) -> None:
         """Assign `number` to the Cell at `key` and
-        update `empty_cells`.
+        update the board.
 
         This overrides a base class method. To assign a number to
         a Point is to change its Cell's number, not to replace the Cell
@@ -188,96 +320,191 @@ class Grid(SquareGameGrid):
 
         self._set_cell(self[key], number)
 
-    def _set_cell(self, cell: Cell, number: int) -> None:
-        """Assign `number` to `Cell` and update `empty_cells`."""
+    def _exponent(self, cell: Cell, number: int) -> int:
+        """Return the exponent of `number`, ensuring it can be assigned
+        to `cell`.
+        """
+
+        if not isinstance(number, int):
+            raise ExpectationError(number, int)
+        if not number:
+            return 0
+        # `bit_length() - 1` is the exponent of a power of 2
+        exponent = number.bit_length() - 1
+        # unlike `is2048like`, this accepts numbers above CEILING, as
+        # long as they fit a field
+        if number < 2 or number & (number - 1) or exponent > self._field:
+            raise CellError(f"Cannot assign {number} to {cell!r}")
+        return exponent
 
-        cell.number = number
+    def _set_cell(self, cell: Cell, number: int) -> None:
+        """Assign `number` to `Cell` and update the board."""
+
+        exponent = self._exponent(cell, number)
+        # `_exponent` already validated `number`
+        cell._number = number
+        index = cell.y * self._side + cell.x
+        shift = index * self._bits
+        top = self._top
+        if top is not None:
+            if exponent >= top:
+                self._top = exponent
+            elif (self._board >> shift) & self._field == top:
+                self._top = None
+        self._board &= ~(self._field << shift)
+        self._board |= exponent << shift
         if number:
-            # `discard` removes an element from a set but doesn't raise
-            # an exception if it wasn't present
-            self.empty_cells.discard(cell)
+            self._empty_mask &= ~(1 << index)
         else:
-            self.empty_cells.add(cell)
+            self._empty_mask |= 1 << index
+
+    def _commit(self, board: int) -> None:
+        """Replace the board with `board`, then update the number of
+        every Cell whose field changed, as well as `_empty_mask` and
+        `_top`.
+        """
 
-    def _neighbor(self, cell: Cell, to: Directions) -> Optional[Cell]:
-        """Return the next `Cell` in the given direction.
+        old = self._board
+        changed = self._fold(old ^ board)
+        self._board = board
+        bits, field, flat = self._bits, self._field, self._flat
+        empty_mask = self._empty_mask
+        # `gained` is the highest exponent written, and `lost` tells
+        # whether a field that held the highest exponent was changed
+        top, gained, lost = self._top, 0, False
+        for index in self._indexes(changed, bits):
+            shift = index * bits
+            exponent = (board >> shift) & field
+            if exponent > gained:
+                gained = exponent
+            if (old >> shift) & field == top:
+                lost = True
+            # every field of a board holds a valid exponent, so the
+            # validation done by the `Cell.number` setter is skipped
+            if exponent:
+                flat[index]._number = 1 << exponent
+                empty_mask &= ~(1 << index)
+            else:
+                flat[index]._number = 0
+                empty_mask |= 1 << index
+        self._empty_mask = empty_mask
+        if top is not None:
+            # no unchanged field can exceed the old `top`
+            if gained >= top:
+                self._top = gained
+            elif lost:
+                self._top = None
+
+    def _fold(self, board: int) -> int:
+        """Return an `int` with the lowest bit of each non-zero field
+        of `board` set, and every other bit unset.
+
+        The bits of each field are ORed into its lowest bit, so that
+        the lowest bit is unset only if the whole field is 0.
+        """
+
+        folded = board
+        for shift in range(1, self._bits):
+            folded |= board >> shift
+        return self._low & folded
 
-        Returns `None` if there's no such `Cell` (if `cell` is at the
-        edge of the board, for example).
+    @staticmethod
+    def _indexes(mask: int, step: int = 1) -> list[int]:
+        """Return the position of every set bit of `mask`, divided by
+        `step`, in ascending order.
+
+        With the default `step`, that's the index of every Cell set in
+        a mask such as `_empty_mask`; with `step=_bits`, it's the index
+        of every field whose lowest bit is set, as returned by `_fold`.
         """
 
-        shift = self._SHIFTS[to]
-        x = cell.x + shift[0]
-        y = cell.y + shift[1]
-        try:
-            next_point = Point(x, y)  # NegativeIntegerError
-            next_cell = self[next_point]  # KeyError
-        except (NegativeIntegerError, KeyError):
-            return None
-        assert isinstance(next_cell, type(cell))
-        return next_cell
-
-    def _pivot(self, cell: Cell, to: Directions) -> Cell:
-        """Return either `cell` itself, or the Cell it will interact
-        with.
-
-        This never returns `None`. It returns either:
-        i) the first unlocked Cell with a matching number; or
-        ii) the last empty Cell in direction `to`, if there's any; or
-        iii) `cell` itself.
-
-        Remember that "CellX is empty" means `CellX.number == 0`.
+        indexes = []
+        while mask:
+            # `mask & -mask` isolates the lowest set bit
+            lowest = mask & -mask
+            indexes.append((lowest.bit_length() - 1) // step)
+            mask ^= lowest
+        return indexes
+
+    @staticmethod
+    def _nth_set_bit(mask: int, rank: int) -> int:
+        """Return the position of the set bit of `mask` that has `rank`
+        set bits below it."""
+
+        for _ in range(rank):
+            # `mask & (mask - 1)` clears the lowest set bit
+            mask &= mask - 1
+        return (mask & -mask).bit_length() - 1
+
+    def _reverse_row(self, row: int) -> int:
+        """Return `row` with its fields in the opposite order."""
+
+        bits, field, last = self._bits, self._field, self._side - 1
+        reversed_row = 0
+        for index in range(self._side):
+            exponent = (row >> (index * bits)) & field
+            reversed_row |= exponent << ((last - index) * bits)
+        return reversed_row
+
+    def _slide_row(self, row: int) -> tuple[int, int]:
+        """Slide every field of `row` towards its first (lowest) one,
+        merging equal neighbors.
+
+        Empty fields are skipped; then each pair of equal exponents
+        merges into the next exponent, at most once per field and from
+        the first field to the last.
+
+        :return tuple[int, int]: the resulting row and how much the
+            score increases due to merges
         """
 
-        current = last = cell
-        target = cell.number
-        while True:
-            current = self._neighbor(current, to)
-            # a 0-numbered Cell is falsy, so explicitly check for None
-            if current is None:  # edge of the board; give up
-                return last
-            if not current:  # empty Cell; keep looking
-                last = current
-                continue
-            if current.number == target and not current.is_locked:
-                return current
-            # in this case, the Cell exists and isn't empty, but is bad
-            return last
-
-    def _move_cell(self, cell: Cell, to: Directions) -> bool:
-        """Attempt to move `cell` in direction `to`.
-
-        When successful, lock the pivot and update the score (if the
-        starting number was positive), then update the numbers of
-        `cell` and of its pivot.
-
-        :return bool: whether movement occurred
+        bits, field = self._bits, self._field
+        exponents = [
+            exponent
+            for index in range(self._side)
+            if (exponent := (row >> (index * bits)) & field)
+        ]
+        slid = score = 0
+        target = 0  # the index of the next field to fill
+        while exponents:
+            exponent = exponents.pop(0)
+            if exponents and exponents[0] == exponent:
+                del exponents[0]
+                exponent += 1
+                if exponent > field:
+                    # only possible with Cells assigned directly
+                    raise GridError(
+                        f"Cannot merge two {1 << (exponent - 1)}s: "
+                        "the result doesn't fit this grid"
+                    )
+                score += 1 << exponent
+            slid |= exponent << (target * bits)
+            target += 1
+        return slid, score
+
+    def _new_slide(self, row: int, reverse: bool) -> tuple[int, int]:
+        """Compute what `row` becomes after sliding, and store the result
+        in the appropriate slide table.
+
+        :param bool reverse: whether to slide to the right instead of
+            to the left
         """
 
-        if not cell:  # empty Cells don't move
-            return False
-        pivot = self._pivot(cell, to)
-        if pivot == cell:  # a Cell can't move into itself
-            return False
-        # we can't use `cell.number * 2` or `pivot.number * 2` because
-        # the numbers differ when a positive Cell moves into a 0 one
-        new_number = cell.number + pivot.number
-        # in the original game the score only increases when a Cell
-        # moves into a positive pivot
-        if pivot:
-            pivot.lock()  # prevent further movement this cycle
-            self.score += new_number
-        self._set_cell(cell, 0)
-        self._set_cell(pivot, new_number)
-        return True
+        if reverse:
+            slid, score = self._slide_row(self._reverse_row(row))
+            slid = self._reverse_row(slid)
+        else:
+            slid, score = self._slide_row(row)
+        self._slide_tables[reverse][row] = (slid, score)
+        return slid, score
 
-    def _get_vectors(self, to: Directions) -> Iterator[Line]:
-        """Return each row or column, from closest to
-        farthest from `to`.
+    def _get_drag_mode(self, to: Directions) -> tuple[bool, bool]:
+        """Return whether dragging towards `to` must transpose the
+        board and whether it must reverse each row.
         """
 
         try:
-            method = self._vectors_getters[to]
+            return self._DRAG_MODES[to]
         except KeyError:
             if isinstance(to, Directions):
                 # very bad
@@ -287,19 +514,72 @@ class Grid(SquareGameGrid):
             else:
                 # EVEN WORSE
                 raise ExpectationError(to, Directions)
-        return method()
 
     def _autofill(self) -> None:
-        for cell in self.cells():
-            cell.unlock()
-            self._set_cell(cell, random.choice(self._AUTO_NUMBERS))
+        # draw every number at once instead of calling `random.choice`
+        # once per Cell, then build the whole board before committing it;
+        # `_AUTO_NUMBERS` is read from the instance, so that subclasses
+        # can override it
+        numbers = random.choices(self._AUTO_NUMBERS, k=len(self))
+        board = 0
+        for shift, cell, number in zip(self._field_shifts, self._flat, numbers):
+            board |= self._exponent(cell, number) << shift
+        self._commit(board)
+
+    def _check_board(self, board: int) -> None:
+        """Ensure a given board has at least one positive value."""
+
+        if not board:
+            raise GridError(f"Cannot record an empty board: {self!r}")
+
+    def _store_board(self) -> None:
+        """Store the current board in `history`, unchecked.
+
+        Only for internal callers that just made the board non-empty,
+        such as `seed` and `autofill`; anything else should call
+        `store_snapshot`.
+        """
 
-    @staticmethod
-    def _check_snapshot(snapshot: Snapshot) -> None:
-        """Ensure a given snapshot has at least one positive value."""
+        self.history.append(self._board)
+
+    def _encode(self, snapshot: Snapshot) -> int:
+        """Return the current board updated with the values of
+        `snapshot`.
 
-        if not any(snapshot.values()):
-            raise GridError(f"Cannot record an empty snapshot: {snapshot}")
+        Points missing from `snapshot` keep their current numbers.
+        Whether the result is empty is up to the caller to check.
+        """
+
+        board, bits, field = self._board, self._bits, self._field
+        for point, number in snapshot.items():
+            # `point` may be a plain `(x, y)` tuple, so the Cell tells
+            # where its field is
+            cell = self[point]
+            shift = (cell.y * self._side + cell.x) * bits
+            board &= ~(field << shift)
+            board |= self._exponent(cell, number) << shift
+        return board
+
+    def _decode(self, board: int) -> Snapshot:
+        """Return the `Snapshot` that matches `board`."""
+
+        field = self._field
+        snapshot = {}
+        for shift, cell in zip(self._field_shifts, self._flat):
+            exponent = (board >> shift) & field
+            snapshot[cell.point] = (1 << exponent) if exponent else 0
+        return snapshot
+
+    def _restore(self, board: int) -> None:
+        """Replace the board with `board`.
+
+        This DOESN'T store a snapshot.
+        """
+
+        self._check_board(board)
+        self._commit(board)
+        if __debug__:
+            self.check_integrity()
 
     # -- "public" methods
     # these are the methods expected to be called from outside this
@@ -312,23 +592,45 @@ class Grid(SquareGameGrid):
         :return bool: either valid or invalid.
         """
 
-        return either_0_power2(number) and (2 <= number <= cls.CEILING)
+        # the comparisons go first because they're cheaper and also
+        # rule out negative numbers
+        return (
+            isinstance(number, int)
+            and 2 <= number <= cls.CEILING
+            # `either_0_power2`, inlined
+            and not number & (number - 1)
+        )
+
+    def cells(self, by: RowOrCol = "rows") -> Iterator[Cell]:
+        """Yield every Cell, just like `values`.
+
+        Row by row, which is the default, this doesn't sort the Points
+        on every call, since their order never changes.
+        """
+
+        if by == "rows":
+            return iter(self._flat)
+        return self.values(by=by)
+
+    @property
+    def empty_cells(self) -> set[Cell]:
+        """Return which Cells are empty (ie, 0-numbered)."""
+
+        flat = self._flat
+        return {flat[index] for index in self._indexes(self._empty_mask)}
 
     def reset(self) -> None:
         """Set all counters and Cells to 0 and clear the snapshots
         history.
-
-        Also unlock every Cell.
         """
 
         self.attempt = 0
         self.cycle = 0
         self.score = 0
-        for cell in self.cells():
-            cell.unlock()
-            self._set_cell(cell, 0)
+        self._commit(0)
         self.history.clear()
-        self.check_integrity()
+        if __debug__:
+            self.check_integrity()
 
     def store_snapshot(self, snapshot: Optional[Snapshot] = None) -> None:
         """Store a game state in `history`.
@@ -337,24 +639,31 @@ class Grid(SquareGameGrid):
         the current game state.
         """
 
-        if snapshot is None:
-            snapshot = {point: cell.number for point, cell in self.items()}
-        self._check_snapshot(snapshot)
-        self.history.append(snapshot)
+        board = self._board if snapshot is None else self._encode(snapshot)
+        self._check_board(board)
+        self.history.append(board)
 
     def update_with_snapshot(self, snapshot: Snapshot) -> None:
         """Replace each Cell number with the corresponding
         `snapshot` value.
 
-        Also unlock every Cell. This DOESN'T store a snapshot.
+        This DOESN'T store a snapshot.
         """
 
-        self._check_snapshot(snapshot)
-        for point, number in snapshot.items():
-            cell = self[point]
-            cell.unlock()
-            self._set_cell(cell, number)
-        self.check_integrity()
+        self._restore(self._encode(snapshot))
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """Return the current game state as a `Snapshot`."""
+
+        return self._decode(self._board)
+
+    def snapshots(self) -> Iterator[Snapshot]:
+        """Yield each game state in `history` as a `Snapshot`, from
+        oldest to newest.
+        """
+
+        return (self._decode(board) for board in self.history)
 
     @classmethod
     def new_from_snapshot(cls, snapshot: Snapshot) -> Grid:
@@ -389,79 +698,103 @@ class Grid(SquareGameGrid):
         del self.history[-1]
         # now the last snapshot is the previous state, so we retrieve
         # and keep it stored, because it is now the current state
-        self.update_with_snapshot(self.history[-1])
+        self._restore(self.history[-1])
         return True
 
     @property
     def largest(self) -> int:
-        return max((cell.number for cell in self.cells()), default=0)
+        """Return the number of the highest Cell(s)."""
+
+        if self._top is None:
+            board, field = self._board, self._field
+            self._top = max(
+                (board >> shift) & field for shift in self._field_shifts
+            )
+        return (1 << self._top) if self._top else 0
 
     @property
     def is_empty(self) -> bool:
         """Return whether every Cell is empty (ie, 0-numbered)."""
 
-        empties, cells = len(self.empty_cells), len(self)
-        assert empties <= cells, f"{self!r} has more empty Cells than Cells!"
-        return empties == cells
+        return not self._board
 
     def seed(self, amount: int = STARTING_AMOUNT) -> None:
-        """Assign a random integer from `Grid.SEEDING_VALUES` to
-        randomly selected empty Cells.
+        """Assign a random integer from `Grid.SEEDING_VALUES`, weighted
+        by `Grid.SEEDING_WEIGHTS` (if any), to randomly selected empty
+        Cells.
 
         :param int amount: how many cells to seed;
             defaults to `STARTING_AMOUNT`
         """
 
-        logger.debug(
-            "Available cells for seeding: %s.",
-            "  ".join(
-                repr(e) for e in sorted(cast(Iterable, self.empty_cells))
-            ),
-        )
+        # rather than listing the empty Cells, pick which ones to seed
+        # by their rank among the set bits of `_empty_mask`
+        mask = self._empty_mask
+        available = bin(mask).count("1")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Available cells for seeding: %s.",
+                "  ".join(repr(self._flat[i]) for i in self._indexes(mask)),
+            )
+        if amount == 1:
+            # the usual case, as every successful drag seeds 1 Cell
+            ranks = [random.randrange(available)]
+        else:
+            ranks = random.sample(range(available), amount)
         changed: list[Cell] = []
-        for cell in random.sample(self.empty_cells, amount):
+        numbers = random.choices(
+            self.SEEDING_VALUES, weights=self.SEEDING_WEIGHTS, k=amount
+        )
+        for rank, number in zip(ranks, numbers):
+            cell = self._flat[self._nth_set_bit(mask, rank)]
             if cell:
                 raise GridError("A non-zero Cell has been selected for seeding")
-            self._set_cell(cell, random.choice(self.SEEDING_VALUES))
+            self._set_cell(cell, number)
             changed.append(cell)
         if not changed:
             raise GridError("Seeding didn't change the number of any Cell")
-        changed.sort()
-        logger.debug(
-            "Seeded those cells: %s.",
-            "  ".join(map(repr, changed)),
-        )
-        self.store_snapshot()
+        if logger.isEnabledFor(logging.DEBUG):
+            changed.sort()
+            logger.debug(
+                "Seeded those cells: %s.",
+                "  ".join(map(repr, changed)),
+            )
+        self._store_board()
 
     def drag(self, to: Directions) -> bool:
-        """Try to move every Cell towards `to`, starting by the vectors
-        closest to the origin.
+        """Try to move every Cell towards `to`, one row or column at
+        a time.
 
-        Trying to move left picks the columns from left to right,
-        trying to move right picks columns from right to left, and
-        so on.
+        Every direction is handled as a horizontal drag: vertical
+        drags transpose the board first, so that its columns become
+        rows, and transpose it back at the end. Each row is then
+        looked up in the slide table of its direction, so that its
+        Cells are only moved one by one the first time that row is
+        seen.
 
         Increment the attempt counter, then try to move every Cell in
-        the given direction, starting with the vectors closest to the
-        origin.
+        the given direction, starting with the Cells closest to `to`.
         If that changed anything, increment the cycle counter by 1 and
         seed itself by 1.
 
         :return bool: whether the game state changed
         """
 
-        vectors = self._get_vectors(to)
+        transpose, reverse = self._get_drag_mode(to)
         self.attempt += 1
         logger.debug("Attempt increased to %d.", self.attempt)
-        something_moved = False
-        for cell in chain.from_iterable(vectors):
-            this_moved = self._move_cell(cell, to)
-            something_moved = something_moved or this_moved
+        board = self._transpose(self._board) if transpose else self._board
+        dragged, score = self._slide_rows(
+            board, self._slide_tables[reverse], self._new_slide, reverse
+        )
+        if transpose:
+            dragged = self._transpose(dragged)
+        something_moved = dragged != self._board
         if something_moved:
+            self.score += score
+            self._commit(dragged)
             self.cycle += 1
             self.seed(1)  # will also store a snapshot
-            for cell in self.cells():
-                cell.unlock()
             logger.debug(
                 "Dragging %r changed me; cycle increased to %d.",
                 to,
@@ -476,27 +809,33 @@ class Grid(SquareGameGrid):
         If there's at least one zero `Cell`, the `Grid` isn't jammed,
         because the player can at least fill the blank.
         If there are no zeroes, check if any two adjacent Cells have
-        the same number (no matter whether they're locked); stop as
-        soon as any such pair is found.
-        Is there a better/faster way of doing this without checking
-        every Cell?
+        the same number. That's done for every Cell at once: XORing
+        the board with itself shifted by one field (or by one row)
+        leaves a zero field wherever a Cell equals its right (or lower)
+        neighbor.
         """
 
-        if empties := len(self.empty_cells):
-            logger.debug("Not jammed: still %d empty cell(s).", empties)
+        # the arguments of the debug messages below take some work to
+        # compute, so skip them unless they'll actually be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if mask := self._empty_mask:
+            if debug:
+                logger.debug(
+                    "Not jammed: still %d empty cell(s).", bin(mask).count("1")
+                )
+            return False
+        board = self._board
+        pairs = self._low_h & ~self._fold(board ^ (board >> self._bits))
+        pairs |= self._low_v & ~self._fold(board ^ (board >> self._row_bits))
+        if pairs:
+            if debug:
+                # there may be many, but logging the first is enough
+                lowest = self._indexes(pairs & -pairs, self._bits)[0]
+                logger.debug(
+                    "Not jammed: %r can merge with a neighbor.",
+                    self._flat[lowest],
+                )
             return False
-        for cell in self.cells():
-            for to in Directions:
-                neighbor = self._neighbor(cell, to)
-                if neighbor is None:
-                    continue
-                if cell.number == neighbor.number:
-                    logger.debug(
-                        "Not jammed: %r is next to %r.",
-                        cell,
-                        neighbor,
-                    )
-                    return False
         logger.debug("Jammed grid detected!")
         return True
 
@@ -505,7 +844,6 @@ class Grid(SquareGameGrid):
 
         Store a snapshot afterwards. Each number's always greater than
         0 and smaller than 2048.
-        Also, unlock every Cell.
 
         :param bool no_jamming: if the result cannot be a jammed grid
         """
@@ -515,4 +853,4 @@ class Grid(SquareGameGrid):
         if no_jamming:
             while self.is_jammed:
                 self._autofill()
-        self.store_snapshot()
+        self._store_board()
@@ -51,12 +51,18 @@ FORMATTER = logging.Formatter(
     ),
     datefmt="%H:%M:%S",
 )
+for hand in HANDLERS:
+    hand.setFormatter(FORMATTER)
 
 
 def setup_logger(name: str) -> logging.Logger:
     this_logger = logging.getLogger(name)
+    # `getLogger` returns the same logger for the same name, so calling
+    # this function twice mustn't add the handlers twice (which would
+    # write every record twice)
+    if this_logger.handlers:
+        return this_logger
     for hand in HANDLERS:
-        hand.setFormatter(FORMATTER)
         this_logger.addHandler(hand)
         this_logger.info("Loaded handler: '%s'.", hand)
     this_logger.info("Created '%s'.", this_logger)
@@ -27,19 +27,25 @@ To run, simply:
 # https://www.python.org/dev/peps/pep-0563/
 from __future__ import annotations
 
+import gc
+import pickle
 import random
-import sys
+import weakref
 
 import pytest
 
-from .core import BaseGameGrid, Point
+from .core import BaseGameGrid, Directions, Point, Snapshot
+from .grid import Grid
 from .utils import (
+    CellError,
     ExpectationError,
     NegativeIntegerError,
     classname,
     either_0_power2,
     is_container,
     type_check,
+    type_check_any,
+    type_check_one,
 )
 
 
@@ -114,6 +120,18 @@ class TestUtils:
         for obj, expectation, boolean in bads:
             with pytest.raises(ExpectationError):
                 type_check(obj, expectation, was_positive=boolean)
+        # the specialized functions must agree with `type_check`
+        for obj, expectation, boolean in goods:
+            if is_container(expectation):
+                type_check_any(obj, expectation, was_positive=boolean)
+            else:
+                type_check_one(obj, expectation, was_positive=boolean)
+        for obj, expectation, boolean in bads:
+            with pytest.raises(ExpectationError):
+                if is_container(expectation):
+                    type_check_any(obj, expectation, was_positive=boolean)
+                else:
+                    type_check_one(obj, expectation, was_positive=boolean)
 
 
 class TestPoint:
@@ -152,15 +170,19 @@ class IntGameGrid(BaseGameGrid):
         return new
 
     def _shuffle(self) -> None:
-        pool = list(self.mapping.values())
-        for point, current in self.mapping.items():
-            # random.randint includes both boundaries
-            i = random.randint(0, len(pool) - 1)
-            while pool[i] == current:
-                i = random.randint(0, len(pool) - 1)
-            self.mapping[point] = pool.pop(i)
-        if pool:
-            sys.exit("IntGameGrid._shuffle didn't work as expected; aborting.")
+        """Move every value to another point, assuming all values are
+        distinct."""
+
+        currents = list(self.mapping.values())
+        pool = currents.copy()
+        random.shuffle(pool)  # Fisher-Yates, in linear time
+        # swapping a value that didn't move with any other one moves
+        # both, because the values are distinct
+        for i, current in enumerate(currents):
+            if pool[i] == current:
+                pool[i], pool[i - 1] = pool[i - 1], pool[i]
+        for point, value in zip(self.mapping, pool):
+            self.mapping[point] = value
 
 
 class TestIntGameGrid:
@@ -224,3 +246,249 @@ class TestIntGameGrid:
         ):
             self._index_columns(grid, cols)
             self._index_rows(grid, cols, rows)
+
+
+class UnseededGrid(Grid):
+    """Grid that doesn't seed random Cells after dragging, so that its
+    game states can be predicted.
+    """
+
+    def seed(self, amount: int = Grid.STARTING_AMOUNT) -> None:
+        self.store_snapshot()
+
+    @classmethod
+    def from_rows(cls, rows: list[list[int]]) -> UnseededGrid:
+        snapshot: Snapshot = {
+            Point(x, y): number
+            for y, row in enumerate(rows)
+            for x, number in enumerate(row)
+        }
+        return cls.new_from_snapshot(snapshot)
+
+    def to_rows(self) -> list[list[int]]:
+        return [[cell.number for cell in row] for row in self.rows()]
+
+
+class TestGrid:
+    ROWS = [
+        [2, 2, 2, 2],
+        [4, 2, 2, 0],
+        [2, 2, 4, 0],
+        [0, 0, 0, 2],
+    ]
+    # what ROWS become after each drag, and the score it's worth
+    DRAGGED = {
+        Directions.LEFT: (
+            [[4, 4, 0, 0], [4, 4, 0, 0], [4, 4, 0, 0], [2, 0, 0, 0]],
+            16,
+        ),
+        Directions.RIGHT: (
+            [[0, 0, 4, 4], [0, 0, 4, 4], [0, 0, 4, 4], [0, 0, 0, 2]],
+            16,
+        ),
+        Directions.UP: (
+            [[2, 4, 4, 4], [4, 2, 4, 0], [2, 0, 0, 0], [0, 0, 0, 0]],
+            12,
+        ),
+        Directions.DOWN: (
+            [[0, 0, 0, 0], [2, 0, 0, 0], [4, 2, 4, 0], [2, 4, 4, 4]],
+            12,
+        ),
+    }
+    JAMMED = [
+        [2, 4, 2, 4],
+        [4, 2, 4, 2],
+        [2, 4, 2, 4],
+        [4, 2, 4, 2],
+    ]
+
+    def test_is2048like(self) -> None:
+        for number in Grid.NUMBERS:
+            assert Grid.is2048like(number)
+        highest = 1 << (Grid.CEILING.bit_length() - 1)
+        assert Grid.is2048like(highest)
+        for bad in (0, 1, 3, -2, -4, 2.0, "2", highest * 2):
+            assert not Grid.is2048like(bad)
+
+    def test_drag(self) -> None:
+        for to, (rows, score) in self.DRAGGED.items():
+            grid = UnseededGrid.from_rows(self.ROWS)
+            assert grid.drag(to)
+            assert grid.to_rows() == rows
+            assert grid.score == score
+            assert grid.attempt == grid.cycle == 1
+
+    def test_drag_other_sides(self) -> None:
+        grid = UnseededGrid.from_rows([[2, 2], [4, 0]])
+        assert grid.drag(Directions.DOWN)
+        assert grid.to_rows() == [[2, 0], [4, 2]]
+        grid = UnseededGrid.from_rows(
+            [[2, 2, 0, 4, 4]] + [[0] * 5] * 3 + [[0, 8, 8, 8, 0]]
+        )
+        assert grid.drag(Directions.LEFT)
+        assert grid.to_rows() == (
+            [[4, 8, 0, 0, 0]] + [[0] * 5] * 3 + [[16, 8, 0, 0, 0]]
+        )
+        assert grid.score == 28
+
+    def test_seed(self) -> None:
+        grid = Grid()
+        assert grid.is_empty
+        grid.seed()
+        assert not grid.is_empty
+        seeded = [cell.number for cell in grid.cells() if cell]
+        assert len(seeded) == Grid.STARTING_AMOUNT
+        assert set(seeded) <= set(Grid.SEEDING_VALUES)
+        assert len(grid.empty_cells) == len(grid) - Grid.STARTING_AMOUNT
+
+    def test_seed_other_values(self) -> None:
+        # subclasses may seed any values, without weighting them
+        class EightsGrid(Grid):
+            SEEDING_VALUES = (2, 4, 8)
+
+        grid = EightsGrid()
+        grid.seed(len(grid))
+        assert {cell.number for cell in grid.cells()} <= {2, 4, 8}
+
+    def test_autofill_other_values(self) -> None:
+        class TwosGrid(Grid):
+            _AUTO_NUMBERS = (2,)
+
+        grid = TwosGrid(4)
+        grid.autofill(no_jamming=False)
+        assert all(cell.number == 2 for cell in grid.cells())
+
+    def test_cells(self) -> None:
+        grid = UnseededGrid.from_rows(self.ROWS)
+        for by in ("rows", "columns"):
+            assert list(grid.cells(by=by)) == list(grid.values(by=by))
+        with pytest.raises(ValueError):
+            list(grid.cells(by="diagonals"))
+
+    def test_setitem(self) -> None:
+        grid = UnseededGrid()
+        grid[Point(3, 0)] = 2
+        grid[Point(1, 0)] = 2
+        assert grid.largest == 2
+        assert grid.drag(Directions.LEFT)
+        assert grid.to_rows()[0] == [4, 0, 0, 0]
+        for bad in (1, 3, 6):
+            with pytest.raises(CellError):
+                grid[Point(0, 1)] = bad
+
+    def test_settled_drag(self) -> None:
+        rows = [
+            [2, 4, 0, 0],
+            [8, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+        grid = UnseededGrid.from_rows(rows)
+        for to in (Directions.LEFT, Directions.UP):
+            assert not grid.drag(to)
+            assert grid.to_rows() == rows
+        assert grid.attempt == 2
+        assert grid.cycle == grid.score == 0
+
+    def test_is_jammed(self) -> None:
+        rows = [row.copy() for row in self.JAMMED]
+        assert UnseededGrid.from_rows(rows).is_jammed
+        # an empty Cell allows movement
+        rows[1][2] = 0
+        assert not UnseededGrid.from_rows(rows).is_jammed
+        # so does a pair of neighbors
+        rows[1][2] = 2
+        assert not UnseededGrid.from_rows(rows).is_jammed
+
+    def test_undo(self) -> None:
+        grid = UnseededGrid.from_rows(self.ROWS)
+        before = grid.snapshot
+        grid.drag(Directions.LEFT)
+        after = grid.snapshot
+        assert list(grid.snapshots()) == [before, after]
+        assert grid.undo()
+        assert grid.to_rows() == self.ROWS
+        assert grid.snapshot == before
+        assert not grid.undo()
+
+    def test_slide_tables_per_class(self) -> None:
+        # a subclass may slide rows differently, so it mustn't share
+        # the slide tables of its base class
+        assert Grid(4)._slide_tables is Grid(4)._slide_tables
+        assert UnseededGrid(4)._slide_tables is not Grid(4)._slide_tables
+
+        # and the tables of a subclass go away along with it
+        class TemporaryGrid(Grid):
+            pass
+
+        TemporaryGrid(4)
+        ref = weakref.ref(TemporaryGrid)
+        del TemporaryGrid
+        gc.collect()
+        assert ref() is None
+
+    def test_past_ceiling(self) -> None:
+        # CEILING only caps the goal; merges must still go past it
+        class LowCeilingGrid(UnseededGrid):
+            CEILING = 2048
+
+        rows = [
+            [32768, 32768, 0, 0],
+            [2048, 2048, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 2],
+        ]
+        grid = LowCeilingGrid.from_rows(rows)
+        assert grid.drag(Directions.LEFT)
+        assert grid.to_rows() == [
+            [65536, 0, 0, 0],
+            [4096, 0, 0, 0],
+            [0, 0, 0, 0],
+            [2, 0, 0, 0],
+        ]
+        assert grid.score == 65536 + 4096
+        snapshot = grid.snapshot
+        grid.update_with_snapshot(snapshot)
+        assert grid.snapshot == snapshot
+        copy = LowCeilingGrid.new_from_snapshot(snapshot)
+        assert copy.to_rows() == grid.to_rows()
+
+    def test_pickle(self) -> None:
+        grid = UnseededGrid.from_rows(self.ROWS)
+        grid.store_snapshot()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(grid, protocol))
+            assert copy.to_rows() == self.ROWS
+            assert copy.history == grid.history
+            assert copy[Point(0, 0)].point == Point(0, 0)
+            original = UnseededGrid.from_rows(self.ROWS)
+            assert copy.drag(Directions.LEFT) == original.drag(Directions.LEFT)
+            assert copy.to_rows() == original.to_rows()
+
+    def test_tuple_snapshot(self) -> None:
+        # like in any mapping of Points, plain `(x, y)` tuples work
+        snapshot = {
+            (x, y): number
+            for y, row in enumerate(self.ROWS)
+            for x, number in enumerate(row)
+        }
+        grid = UnseededGrid.new_from_snapshot(snapshot)
+        assert grid.to_rows() == self.ROWS
+        grid.update_with_snapshot({(0, 3): 8})
+        assert grid[Point(0, 3)].number == 8
+        grid.store_snapshot({(0, 3): 16})
+        assert grid.history[-1] != grid.history[-2]
+
+    def test_largest(self) -> None:
+        grid = UnseededGrid.from_rows(self.ROWS)
+        assert grid.largest == 4
+        grid.drag(Directions.LEFT)
+        grid.drag(Directions.UP)
+        assert grid.largest == 8
+        grid[0, 0] = 0
+        grid[1, 0] = 0
+        assert grid.largest == 4
+        grid[3, 3] = 1024
+        assert grid.largest == 1024
+        grid.undo()
+        assert grid.largest == 4
@@ -26,8 +26,13 @@ The functions aren't related to board games at all; functions and
 classes specific to board games are in core.py.
 """
 
+# allowing postponed evaluation of annotations; see:
+# https://www.python.org/dev/peps/pep-0563/
+from __future__ import annotations
+
 import enum
-import inspect
+import functools
+import sys
 from collections.abc import Collection
 from typing import TYPE_CHECKING, Any, Optional, Sequence, Type, Union
 
@@ -47,6 +52,8 @@ __all__ = [
     "hexid",
     "is_container",
     "type_check",
+    "type_check_any",
+    "type_check_one",
     "typename",
     # exceptions
     "Base2048Error",
@@ -78,17 +85,22 @@ else:
 
 # I use these "constants" because I find them a bit more readable than
 # writing `slice(None)` or `()` everytime
-# this is used in __init__.BaseGameGrid.check_integrity
-EMPTY_TUPLE = tuple()
-# this is used in __init__.GridIndex
+# this is used in core.BaseGameGrid.check_integrity
+EMPTY_TUPLE = ()
+# this is used in core.GridIndex
 NONE_SLICE = slice(None)
+# these are used in is_container, to answer for the most common classes
+# without checking them against the `Collection` ABC; `type` is there
+# because `type_check` mostly gets single classes
+_CONTAINER_CLASSES = frozenset((tuple, list, set, frozenset, dict))
+_NON_CONTAINER_CLASSES = frozenset((type, str, int, float, bool, type(None)))
 
 
 # -- GENERAL-PURPOSE FUNCTIONS
 def typename(thing: Any, /) -> str:
     """Return the name of its argument's class."""
 
-    return thing.__class__.__name__
+    return type(thing).__name__
 
 
 def classname(thing: Any, /) -> str:
@@ -96,11 +108,18 @@ def classname(thing: Any, /) -> str:
     or the name of its argument's class.
     """
 
-    if inspect.isclass(thing):
+    if isinstance(thing, type):
         return thing.__name__
     return typename(thing)
 
 
+# used by ExpectationError: the same few sequences of classes are
+# expected over and over, so their labels are built once and interned
+@functools.lru_cache(maxsize=64)
+def _expectation_label(classes: tuple[Type, ...], /) -> str:
+    return sys.intern("/".join(map(classname, classes)))
+
+
 def hexid(thing: Any, /) -> str:
     """Return the hexadecimal `id` of its argument as a string."""
 
@@ -111,6 +130,18 @@ def is_container(thing: Any, /) -> bool:
     """Determine whether the argument is an iterable, but not a `str`."""
 
     cls = type(thing)
+    # settle the most common classes without even a cache lookup
+    if cls in _CONTAINER_CLASSES:
+        return True
+    if cls in _NON_CONTAINER_CLASSES:
+        return False
+    return _is_container_class(cls)
+
+
+# `issubclass` against an ABC such as `Collection` is slow, and only a
+# handful of classes ever get here, so remember the answer per class
+@functools.lru_cache(maxsize=128)
+def _is_container_class(cls: Type, /) -> bool:
     return issubclass(cls, Collection) and not issubclass(cls, str)
 
 
@@ -130,28 +161,68 @@ def type_check(
     """
 
     if is_container(expected):
-        matches = type(value) in expected
+        type_check_any(value, expected, was_positive)
     else:
-        matches = isinstance(value, expected)
+        type_check_one(value, expected, was_positive)
+
+
+def type_check_one(
+    value: Any, expected: Type, was_positive: bool = True
+) -> None:
+    """Same as `type_check`, for callers that know `expected` is a
+    single class: the `value` must be an instance of it (or of one of
+    its subclasses).
+    """
+
+    # the identity test settles the usual case, an instance of exactly
+    # `expected`, without walking the MRO; `isinstance` still accepts
+    # instances of subclasses, such as Grid subclasses given to
+    # Base2048Frontend
+    matches = type(value) is expected or isinstance(value, expected)
     if matches != was_positive:
         raise ExpectationError(value, expected, was_positive=was_positive)
 
 
+def type_check_any(
+    value: Any, expected: Sequence[Type], was_positive: bool = True
+) -> None:
+    """Same as `type_check`, for callers that know `expected` is a
+    sequence of classes: the type of `value` must be one of them.
+    """
+
+    if (type(value) in expected) != was_positive:
+        raise ExpectationError(value, expected, was_positive=was_positive)
+
+
 def check_int(integer: int, /) -> None:
     """Raise `ExpectationError` if `obj` is not `int`, and
     `NegativeIntegerError` if it's a negative `int`.
     """
 
-    type_check(integer, int)
+    type_check_one(integer, int)
     if integer < 0:
         raise NegativeIntegerError(integer)
 
 
+def _checked_int(integer: int, /) -> None:
+    """Same as `check_int`, but skipped when Python runs with `-O`.
+
+    Only for integers that the package itself produced, such as
+    coordinates computed by a grid; anything coming from outside
+    must go through `check_int`.
+    """
+
+    if __debug__:
+        check_int(integer)
+
+
 def either_0_power2(integer: int, /) -> bool:
     """Adapted from:
     https://www.geeksforgeeks.org/python-program-to-find-whether-a-no-is-power-of-two/
 
-    A power of 2 bitwise-AND its predecessor always equals 0.
+    A power of 2 bitwise-AND its predecessor always equals 0. For a
+    negative `int`, that bitwise-AND is negative too, so negatives
+    need no separate check.
     :param integer: any `int`
     :return: whether `integer` is either 0 or a (positive) power of 2
     """
@@ -195,9 +266,12 @@ class ExpectationError(TypeError):
         was_positive: bool = True,
     ) -> None:
         if is_container(expectation):
-            self.expectation = "/".join(map(classname, expectation))
+            self.expectation = _expectation_label(tuple(expectation))
         else:
             self.expectation = classname(expectation)
+        # keep only the repr and the class name of the offending value,
+        # so that the error neither keeps it alive nor reflects later
+        # changes to it
         self.problem = repr(problem)
         self.problem_type = typename(problem)
         if args:
@@ -229,8 +303,8 @@ class Base2048Error(Exception):
 
 
 class CellError(Base2048Error):
-    """Raised when a Cell is assigned a negative integer, or is locked
-    when its number is non-zero.
+    """Raised when a Cell is assigned a number that isn't 0 or a
+    power of 2.
     """
 
 
@@ -4,7 +4,14 @@
 
 import setuptools
 
-from py2048 import _TESTING, APPNAME, VERSION
+# read the basic "constants" without importing py2048, which would
+# import the whole package and require its dependencies to be installed
+CONSTANTS: dict = {}
+with open("py2048/_version.py", "r", encoding="utf-8") as version_file:
+    exec(version_file.read(), CONSTANTS)
+_TESTING = CONSTANTS["_TESTING"]
+APPNAME = CONSTANTS["APPNAME"]
+VERSION = CONSTANTS["VERSION"]
 
 
 def readme() -> str: